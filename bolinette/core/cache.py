@@ -42,7 +42,7 @@ class Cache:
     def remove(self, key: Any, value: Any) -> None:
         if key not in self:
             raise KeyError(key)
-        self._bag[key] = list(filter(lambda i: i is not value, self._bag[key]))
+        self._bag[key] = [i for i in self._bag[key] if i is not value]
 
     @staticmethod
     def _merge(c1: "Cache", c2: "Cache") -> "Cache":
@@ -64,6 +64,13 @@ class Cache:
     def __ror__(self, other: "Cache", /) -> "Cache":
         return self._merge(self, other)
 
+    def __ior__(self, other: "Cache", /) -> "Cache":
+        for key, values in other._bag.items():
+            if key not in self._bag:
+                self._bag[key] = []
+            self._bag[key].extend(values)
+        return self
+
     @override
     def __eq__(self, other: object, /) -> bool:
         if not isinstance(other, Cache):
@@ -5,6 +5,11 @@ from typing import Any
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 from bolinette.core import Cache, meta
 from bolinette.core.environment.sections import EnvironmentSection, EnvSectionMeta
 from bolinette.core.exceptions import EnvironmentError
@@ -44,20 +49,27 @@ class Environment:
     def _init_env_files(self) -> None:
         profile = self._DEFAULT_PROFILE if self.profile == self._UNINITIALIZED_PROFILE else self.profile
 
+        try:
+            existing = {entry.name for entry in os.scandir(self._env_folder)}
+        except FileNotFoundError:
+            existing = set()
+
         stack = [
             self._init_from_os(),
-            self._init_from_file("env.yaml"),
-            self._init_from_file(f"env.{profile}.yaml"),
-            self._init_from_file(f"env.local.{profile}.yaml"),
+            *(
+                self._init_from_file(file_name)
+                for file_name in ("env.yaml", f"env.{profile}.yaml", f"env.local.{profile}.yaml")
+                if file_name in existing
+            ),
         ]
 
         merged: dict[str, Any] = {}
         for node in stack:
             for name, section in node.items():
-                if name not in merged:
-                    merged[name] = {}
-                for key, value in section.items():
-                    merged[name][key] = value
+                if name in merged:
+                    merged[name].update(section)
+                else:
+                    merged[name] = dict(section)
         self.config = merged
 
     @init_method
@@ -68,11 +80,12 @@ class Environment:
 
     @staticmethod
     def _init_from_os() -> dict[str, dict[str, Any]]:
-        _vars: dict[str, str] = {}
         prefix_len = len(Environment._OS_ENV_PREFIX)
-        for var in os.environ:
-            if var.startswith(Environment._OS_ENV_PREFIX):
-                _vars[var[prefix_len:]] = os.environ[var]
+        _vars: dict[str, str] = {
+            var[prefix_len:]: value
+            for var, value in os.environ.items()
+            if var.startswith(Environment._OS_ENV_PREFIX)
+        }
         _env: dict[str, Any] = {}
         for key, value in _vars.items():
             path = [s.lower() for s in key.split("__")]
@@ -89,11 +102,8 @@ class Environment:
         return _env
 
     def _init_from_file(self, file_name: str) -> dict[str, dict[str, Any]]:
-        try:
-            with open(self._env_folder / file_name) as f:
-                return yaml.safe_load(f)
-        except FileNotFoundError:
-            return {}
+        with open(self._env_folder / file_name) as f:
+            return yaml.load(f, Loader=_YamlLoader)
 
 
 def init_section(section: object, env: Environment, mapper: Mapper) -> None:
@@ -1,4 +1,4 @@
-from typing import Any, override
+from typing import Any, ClassVar, override
 
 
 class BolinetteError(Exception):
@@ -22,8 +22,8 @@ class InternalError(BolinetteError):
 
 
 class ParameterError:
-    def __init__(self, **params: str) -> None:
-        self._error_params = params
+    def __init__(self, params: dict[str, str] | None = None, /, **kw_params: str) -> None:
+        self._error_params = params if params is not None else kw_params
 
     def _format_params(self, message: str, **values: Any) -> str:
         f_strings: list[str] = []
@@ -34,17 +34,21 @@ class ParameterError:
 
 
 class TypingError(BolinetteError, ParameterError):
+    _PARAM_TEMPLATES: ClassVar[dict[str, str]] = {"cls": "Type {}"}
+
     def __init__(
         self,
         message: str,
         *,
         cls: str | None = None,
     ) -> None:
-        ParameterError.__init__(self, cls="Type {}")
+        ParameterError.__init__(self, self._PARAM_TEMPLATES)
         BolinetteError.__init__(self, self._format_params(message, cls=cls))
 
 
 class InjectionError(BolinetteError, ParameterError):
+    _PARAM_TEMPLATES: ClassVar[dict[str, str]] = {"cls": "Type {}", "func": "Callable {}", "param": "Parameter '{}'"}
+
     def __init__(
         self,
         message: str,
@@ -53,7 +57,7 @@ class InjectionError(BolinetteError, ParameterError):
         func: Any | None = None,
         param: str | None = None,
     ) -> None:
-        ParameterError.__init__(self, cls="Type {}", func="Callable {}", param="Parameter '{}'")
+        ParameterError.__init__(self, self._PARAM_TEMPLATES)
         BolinetteError.__init__(self, self._format_params(message, cls=cls, func=func, param=param))
 
 
@@ -1,10 +1,14 @@
+from typing import ClassVar
+
 from bolinette.core import expressions
 from bolinette.core.exceptions import BolinetteError, ParameterError
 
 
 class ExpressionError(BolinetteError, ParameterError):
+    _PARAM_TEMPLATES: ClassVar[dict[str, str]] = {"expr": "Expression {}"}
+
     def __init__(self, expr: "expressions.ExpressionNode", message: str) -> None:
-        ParameterError.__init__(self, expr="Expression {}")
+        ParameterError.__init__(self, self._PARAM_TEMPLATES)
         BolinetteError.__init__(self, self._format_params(message, expr=expr))
 
 
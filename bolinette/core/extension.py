@@ -1,5 +1,5 @@
 from graphlib import CycleError, TopologicalSorter
-from typing import Final, Protocol, TypeVar, override
+from typing import Any, Final, Protocol, TypeVar, override
 
 from bolinette.core import Cache, CoreSection, command
 from bolinette.core.command import Parser, debug_injection_command
@@ -30,6 +30,8 @@ from bolinette.core.types.checker import (
 
 ExtT = TypeVar("ExtT", bound="Extension")
 
+_sort_cache: "dict[tuple[int, ...], list[Extension]]" = {}
+
 
 class ExtensionModule(Protocol[ExtT]):
     __blnt_ext__: ExtT
@@ -45,13 +47,18 @@ class Extension:
 
     @staticmethod
     def sort_extensions(extensions: "list[Extension]") -> "list[Extension]":
+        key = tuple(id(ext) for ext in extensions)
+        if key in _sort_cache:
+            return list(_sort_cache[key])
         sorter: TopologicalSorter[Extension] = TopologicalSorter()
         for ext in extensions:
             sorter.add(ext, *ext.dependencies)
         try:
-            return list(sorter.static_order())
+            sorted_extensions = list(sorter.static_order())
         except CycleError as e:
             raise InitError("A circular dependency was detected in the loaded extensions") from e
+        _sort_cache[key] = sorted_extensions
+        return list(sorted_extensions)
 
 
 class _CoreExtension(Extension):
@@ -60,55 +67,56 @@ class _CoreExtension(Extension):
 
     @override
     def add_cached(self, cache: Cache) -> None:
-        environment("core", cache=cache)(CoreSection)
-
-        injection_callback(cache=cache)(InjectionLogger)
-        injectable(strategy="singleton", cache=cache)(Injection)
-        injectable(strategy="singleton", cache=cache)(Parser)
-        injectable(strategy="singleton", cache=cache)(Environment)
-
-        injection_arg_resolver()(LoggerArgResolver)
-
-        injectable(strategy="singleton", cache=cache)(TypeChecker)
-        type_checker(priority=-700, cache=cache)(ProtocolTypeChecker)
-        type_checker(priority=-800, cache=cache)(TypedDictChecker)
-        type_checker(priority=-900, cache=cache)(LiteralTypeChecker)
-        type_checker(priority=-1000, cache=cache)(DefaultTypeChecker)
-
-        injectable(strategy="singleton", cache=cache)(Mapper)
-        mapping_worker(cache=cache)(IntegerMapper)
-        mapping_worker(cache=cache)(FloatMapper)
-        mapping_worker(cache=cache)(BoolMapper)
-        mapping_worker(cache=cache)(StringMapper)
-        mapping_worker(cache=cache)(BytesMapper)
-        mapping_worker(cache=cache, match_all=True)(LiteralMapper)
-        mapping_worker(cache=cache, match_all=True)(DictMapper)
-        mapping_worker(cache=cache, match_all=True)(SequenceMapper)
-
-        command(
-            "debug injection",
-            "Debug command that lists all registered types",
-            cache=cache,
-            run_startup=False,
-        )(debug_injection_command)
+        for factory, args, kwargs, target in _CORE_REGISTRATIONS:
+            factory(*args, cache=cache, **kwargs)(target)
 
 
 core_ext: Final[Extension] = _CoreExtension()
 
 
 class InjectionLogger:
+    _SESSION_MESSAGES: Final[dict[str, str]] = {
+        "session_open": "Scoped session open",
+        "session_closed": "Scoped session closed",
+        "async_session_open": "Async scoped session open",
+        "async_session_closed": "Async scoped session closed",
+    }
+
     def __init__(self, logger: Logger[Injection]) -> None:
         self.logger = logger
 
     def __call__(self, event: InjectionEvent) -> None:
-        match event["event"]:
-            case "instantiated":
-                self.logger.debug(f"Instantiated {event['type']} with strategy '{event['strategy']}'")
-            case "session_open":
-                self.logger.debug("Scoped session open")
-            case "session_closed":
-                self.logger.debug("Scoped session closed")
-            case "async_session_open":
-                self.logger.debug("Async scoped session open")
-            case "async_session_closed":
-                self.logger.debug("Async scoped session closed")
+        if event["event"] == "instantiated":
+            self.logger.debug("Instantiated %s with strategy '%s'", event["type"], event["strategy"])
+        elif (message := self._SESSION_MESSAGES.get(event["event"])) is not None:
+            self.logger.debug(message)
+
+
+_CORE_REGISTRATIONS: "list[tuple[Any, tuple[Any, ...], dict[str, Any], Any]]" = [
+    (environment, ("core",), {}, CoreSection),
+    (injection_callback, (), {}, InjectionLogger),
+    (injectable, (), {"strategy": "singleton"}, Injection),
+    (injectable, (), {"strategy": "singleton"}, Parser),
+    (injectable, (), {"strategy": "singleton"}, Environment),
+    (injection_arg_resolver, (), {}, LoggerArgResolver),
+    (injectable, (), {"strategy": "singleton"}, TypeChecker),
+    (type_checker, (), {"priority": -700}, ProtocolTypeChecker),
+    (type_checker, (), {"priority": -800}, TypedDictChecker),
+    (type_checker, (), {"priority": -900}, LiteralTypeChecker),
+    (type_checker, (), {"priority": -1000}, DefaultTypeChecker),
+    (injectable, (), {"strategy": "singleton"}, Mapper),
+    (mapping_worker, (), {}, IntegerMapper),
+    (mapping_worker, (), {}, FloatMapper),
+    (mapping_worker, (), {}, BoolMapper),
+    (mapping_worker, (), {}, StringMapper),
+    (mapping_worker, (), {}, BytesMapper),
+    (mapping_worker, (), {"match_all": True}, LiteralMapper),
+    (mapping_worker, (), {"match_all": True}, DictMapper),
+    (mapping_worker, (), {"match_all": True}, SequenceMapper),
+    (
+        command,
+        ("debug injection", "Debug command that lists all registered types"),
+        {"run_startup": False},
+        debug_injection_command,
+    ),
+]
@@ -5,6 +5,8 @@ from bolinette.core.types import Function, Type
 
 
 class InjectionContext:
+    __slots__ = ("origin", "strategy", "arg_name", "default_set", "default")
+
     def __init__(
         self,
         origin: Type[Any] | Function[..., Any],
@@ -7,6 +7,8 @@ from bolinette.core.types import Type
 
 
 class InjectionHook[InstanceT]:
+    __slots__ = ("t", "default_set", "default")
+
     def __init__(
         self,
         t: Type[InstanceT],
@@ -31,6 +33,8 @@ class InjectionHook[InstanceT]:
 
 
 class InjectionProxy[InstanceT]:
+    __slots__ = ("t", "context")
+
     def __init__(
         self,
         t: Type[InstanceT],
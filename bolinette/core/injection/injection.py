@@ -1,6 +1,7 @@
 from collections.abc import Callable, Iterable
 from types import TracebackType
 from typing import Any, Generic, Literal, Protocol, Self, TypedDict, overload, override, runtime_checkable
+from weakref import WeakKeyDictionary
 
 from bolinette.core import Cache, __user_cache__, meta
 from bolinette.core.exceptions import InjectionError
@@ -19,10 +20,13 @@ from bolinette.core.injection.resolver import ArgResolverMeta, ArgResolverOption
 from bolinette.core.types import Function, Type, TypeVarLookup
 from bolinette.core.utils import OrderedSet
 
+_init_methods_cache: "WeakKeyDictionary[type[Any], tuple[Callable[..., Any], ...]]" = WeakKeyDictionary()
+
 
 class Injection:
     _ADD_INSTANCE_STRATEGIES = ("singleton",)
     _REQUIREABLE_STRATEGIES = ("singleton", "transient")
+    _NON_SCOPED_STRATEGIES = ("singleton", "transient")
 
     def __init__(
         self,
@@ -30,6 +34,7 @@ class Injection:
         global_pool: InstancePool | None = None,
         types: "dict[type[Any], RegisteredTypeBag[Any]] | None" = None,
         resolvers: list[ArgumentResolver] | None = None,
+        callbacks: "Iterable[InjectionCallback] | None" = None,
     ) -> None:
         self.cache = cache
         self._callbacks: Iterable[InjectionCallback] = []
@@ -39,7 +44,7 @@ class Injection:
         self._register_type(Type(Cache), Type(Cache), False, "singleton", {}, instance=cache, safe=True)
         self._register_type(Type(Injection), Type(Injection), False, "singleton", {}, instance=self, safe=True)
         self._arg_resolvers = self._pickup_resolvers(cache, resolvers or [])
-        self._callbacks = self._pickup_callbacks()
+        self._callbacks = callbacks if callbacks is not None else self._pickup_callbacks()
 
     @property
     def registered_types(self) -> dict[type[Any], RegisteredTypeBag[Any]]:
@@ -138,10 +143,20 @@ class Injection:
     def _get_instance[InstanceT](self, t: Type[InstanceT]) -> InstanceT:
         return self._global_pool.get_instance(t)
 
+    def _try_get_instance[InstanceT](self, t: Type[InstanceT]) -> InstanceT | None:
+        return self._global_pool.try_get_instance(t)
+
     def _set_instance[InstanceT](self, r_type: RegisteredType[InstanceT], instance: InstanceT) -> None:
         if r_type.strategy == "singleton":
             self._global_pool.set_instance(r_type.implmt_t, instance)
 
+    @staticmethod
+    def _guard_circular_call(obj: Type[Any] | Function[..., Any], circular_guard: OrderedSet[Any]) -> None:
+        if obj in circular_guard:
+            call_chain = " -> ".join(str(f) for f in circular_guard) + f" -> {obj}"
+            raise InjectionError(f"A circular call has been detected: {call_chain}", cls=circular_guard[0])
+        circular_guard.add(obj)
+
     def _resolve_args(
         self,
         obj: Type[Any] | Function[..., Any],
@@ -153,10 +168,7 @@ class Injection:
         named_args: dict[str, Any],
         additional_resolvers: list[ArgumentResolver],
     ) -> dict[str, Any]:
-        if obj in circular_guard:
-            call_chain = " -> ".join(str(f) for f in circular_guard) + f" -> {obj}"
-            raise InjectionError(f"A circular call has been detected: {call_chain}", cls=circular_guard[0])
-        circular_guard.add(obj)
+        self._guard_circular_call(obj, circular_guard)
 
         try:
             if isinstance(obj, Function):
@@ -167,7 +179,7 @@ class Injection:
             raise InjectionError(f"Type hint '{exp.name}' could not be resolved", func=obj) from exp
         func_params = obj.parameters()
 
-        if any((n, p) for n, p in func_params.items() if p.kind in (p.POSITIONAL_ONLY, p.VAR_POSITIONAL)):
+        if obj.has_positional_params():
             raise InjectionError(
                 "Positional only parameters and positional wildcards are not allowed",
                 func=obj,
@@ -240,7 +252,7 @@ class Injection:
         if t.cls is type:
             return t.vars[0]
 
-        if self.is_registered(t):
+        if (type_bag := self._types.get(t.cls)) is not None and type_bag.is_registered(t):
             return self._resolve_type_default(t, context, circular_guard, additional_resolvers)
 
         all_resolvers = [*additional_resolvers, *self._arg_resolvers]
@@ -272,10 +284,10 @@ class Injection:
         circular_guard: OrderedSet[Any],
         additional_resolvers: list[ArgumentResolver],
     ) -> Any:
-        r_type = self.registered_types[t.cls].get_type(t)
+        r_type = self._types[t.cls].get_type(t)
 
         if r_type.strategy == "scoped":
-            if context and context.strategy in ["singleton", "transient"]:
+            if context and context.strategy in self._NON_SCOPED_STRATEGIES:
                 raise InjectionError(
                     f"Cannot instantiate a scoped service in a {context.strategy} service",
                     func=context.origin,
@@ -284,8 +296,8 @@ class Injection:
             if not self.is_scoped:
                 raise InjectionError(f"Cannot instantiate scoped service {t} from a non scoped injection context")
 
-        if self._has_instance(r_type.implmt_t):
-            return self._get_instance(r_type.implmt_t)
+        if (instance := self._try_get_instance(r_type.implmt_t)) is not None:
+            return instance
         return self._instantiate(r_type, circular_guard, additional_resolvers)
 
     def __hook_proxies__(self, t: Type[Any], strategy: InjectionStrategy, instance: object) -> None:
@@ -309,29 +321,40 @@ class Injection:
                 InjectionProxy(hook.t, InjectionContext(t, strategy, name, hook.default_set, hook.default)),
             )
 
-    def _run_init_recursive[InstanceT](
+    @staticmethod
+    def _get_init_methods(cls: type[Any]) -> tuple[Callable[..., Any], ...]:
+        if (methods := _init_methods_cache.get(cls)) is None:
+            collected: dict[Callable[..., Any], None] = {}
+
+            def _collect(_cls: type[Any]) -> None:
+                for base in _cls.__bases__:
+                    if base in (object, Generic):
+                        continue
+                    _collect(base)
+                for attr in vars(_cls).values():
+                    if meta.has(attr, InitMethodMeta):
+                        collected[attr] = None
+
+            _collect(cls)
+            methods = _init_methods_cache[cls] = tuple(collected)
+        return methods
+
+    def _run_class_init_methods[InstanceT](
         self,
         cls: type[InstanceT],
         instance: InstanceT,
         vars_lookup: TypeVarLookup[InstanceT] | None,
         circular_guard: OrderedSet[Any] | None,
-        init_meth_guard: set[Callable[..., Any]],
         additional_resolvers: list[ArgumentResolver],
     ) -> None:
-        for base in cls.__bases__:
-            if base in (object, Generic):
-                continue
-            self._run_init_recursive(base, instance, vars_lookup, circular_guard, init_meth_guard, additional_resolvers)
-        for _, attr in vars(cls).items():
-            if meta.has(attr, InitMethodMeta) and attr not in init_meth_guard:
-                self.call(
-                    attr,
-                    args=[instance],
-                    vars_lookup=vars_lookup,
-                    additional_resolvers=additional_resolvers,
-                    circular_guard=circular_guard,
-                )
-                init_meth_guard.add(attr)
+        for method in self._get_init_methods(cls):
+            self.call(
+                method,
+                args=[instance],
+                vars_lookup=vars_lookup,
+                additional_resolvers=additional_resolvers,
+                circular_guard=circular_guard,
+            )
 
     def _run_init_methods[InstanceT](
         self,
@@ -343,9 +366,7 @@ class Injection:
     ):
         for method in r_type.before_init:
             self.call(method, args=[instance], circular_guard=circular_guard)
-        self._run_init_recursive(
-            r_type.implmt_t.cls, instance, vars_lookup, circular_guard, set(), additional_resolvers
-        )
+        self._run_class_init_methods(r_type.implmt_t.cls, instance, vars_lookup, circular_guard, additional_resolvers)
         for method in r_type.after_init:
             self.call(method, args=[instance], circular_guard=circular_guard)
 
@@ -355,17 +376,21 @@ class Injection:
         circular_guard: OrderedSet[Any],
         additional_resolvers: list[ArgumentResolver],
     ) -> InstanceT:
-        vars_lookup = TypeVarLookup(r_type.implmt_t)
-        func_args = self._resolve_args(
-            r_type.implmt_t,
-            r_type.strategy,  # pyright: ignore[reportArgumentType]
-            vars_lookup,
-            False,
-            circular_guard,
-            r_type.args,
-            r_type.named_args,
-            additional_resolvers,
-        )
+        vars_lookup = r_type.implmt_t.lookup
+        if (func_args := r_type.arg_plan) is not None:
+            self._guard_circular_call(r_type.implmt_t, circular_guard)
+        else:
+            func_args = self._resolve_args(
+                r_type.implmt_t,
+                r_type.strategy,  # pyright: ignore[reportArgumentType]
+                vars_lookup,
+                False,
+                circular_guard,
+                r_type.args,
+                r_type.named_args,
+                additional_resolvers,
+            )
+            r_type.arg_plan = func_args
         instance: InstanceT = r_type.implmt_t.cls(**func_args)
         self.__hook_proxies__(
             r_type.implmt_t,
@@ -431,7 +456,7 @@ class Injection:
         additional_resolvers: list[ArgumentResolver] | None = None,
     ) -> InstanceT:
         t = Type(cls)
-        vars_lookup = TypeVarLookup(t)
+        vars_lookup = t.lookup
         init_args = self._resolve_args(
             t,
             "immediate",
@@ -445,7 +470,7 @@ class Injection:
         instance = cls(**init_args)
         self.__hook_proxies__(t, "immediate", instance)
         meta.set(instance, self, cls=Injection)
-        self._run_init_recursive(cls, instance, vars_lookup, None, set(), additional_resolvers or [])
+        self._run_class_init_methods(cls, instance, vars_lookup, None, additional_resolvers or [])
         if isinstance(instance, HasEnter):
             instance.__enter__()
         return instance
@@ -613,13 +638,19 @@ class Injection:
         return self._resolve_type(t, context, OrderedSet(), [])
 
     def require[InstanceT](self, cls: type[InstanceT]) -> InstanceT:
+        if cls is Injection or cls is type(self):
+            return self  # pyright: ignore[reportReturnType]
         return self.__require__(Type(cls), None)
 
     def get_scoped_session(self) -> "ScopedInjection":
-        return ScopedInjection(self.cache, self._global_pool, InstancePool(), self._types, self._arg_resolvers)
+        return ScopedInjection(
+            self.cache, self._global_pool, InstancePool(), self._types, self._arg_resolvers, self._callbacks
+        )
 
     def get_async_scoped_session(self) -> "AsyncScopedSession":
-        return AsyncScopedSession(self.cache, self._global_pool, InstancePool(), self._types, self._arg_resolvers)
+        return AsyncScopedSession(
+            self.cache, self._global_pool, InstancePool(), self._types, self._arg_resolvers, self._callbacks
+        )
 
     def __enter__(self) -> Self:
         return self
@@ -643,9 +674,10 @@ class ScopedInjection(Injection):
         scoped_pool: InstancePool,
         types: "dict[type[Any], RegisteredTypeBag[Any]]",
         resolvers: list[ArgumentResolver] | None = None,
+        callbacks: "Iterable[InjectionCallback] | None" = None,
     ) -> None:
         self._scoped_pool = scoped_pool
-        super().__init__(cache, global_pool, types, resolvers)
+        super().__init__(cache, global_pool, types, resolvers, callbacks)
         self._scoped_pool.set_instance(Type(Injection), self)
 
     @property
@@ -663,6 +695,12 @@ class ScopedInjection(Injection):
             return self._scoped_pool.get_instance(t)
         return self._global_pool.get_instance(t)
 
+    @override
+    def _try_get_instance[InstanceT](self, t: Type[InstanceT]) -> InstanceT | None:
+        if (instance := self._scoped_pool.try_get_instance(t)) is not None:
+            return instance
+        return self._global_pool.try_get_instance(t)
+
     @override
     def _set_instance[InstanceT](self, r_type: RegisteredType[InstanceT], instance: InstanceT) -> None:
         strategy = r_type.strategy
@@ -727,8 +765,9 @@ class AsyncScopedSession(ScopedInjection):
         scoped_pool: InstancePool,
         types: dict[type, RegisteredTypeBag[Any]],
         resolvers: list[ArgumentResolver] | None = None,
+        callbacks: "Iterable[InjectionCallback] | None" = None,
     ) -> None:
-        super().__init__(cache, global_pool, scoped_pool, types, resolvers)
+        super().__init__(cache, global_pool, scoped_pool, types, resolvers, callbacks)
 
     async def __aenter__(self) -> Self:
         self._notify_callbacks({"event": "async_session_open"})
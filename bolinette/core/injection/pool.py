@@ -17,6 +17,9 @@ class InstancePool:
     def get_instance[InstanceT](self, t: Type[InstanceT]) -> InstanceT:
         return self._instances[t]
 
+    def try_get_instance[InstanceT](self, t: Type[InstanceT]) -> InstanceT | None:
+        return self._instances.get(t)
+
     @overload
     def get_instances(self) -> Iterable[Any]: ...
 
@@ -16,6 +16,18 @@ class RegistrationOptions[InstanceT](TypedDict):
 
 
 class RegisteredType[InstanceT]:
+    __slots__ = (
+        "intrfc_t",
+        "implmt_t",
+        "strategy",
+        "options",
+        "args",
+        "named_args",
+        "before_init",
+        "after_init",
+        "arg_plan",
+    )
+
     def __init__(
         self,
         intrfc_t: Type[InstanceT],
@@ -31,6 +43,7 @@ class RegisteredType[InstanceT]:
         self.named_args = options.get("named_args", {})
         self.before_init = options.get("before_init", [])
         self.after_init = options.get("after_init", [])
+        self.arg_plan: dict[str, Any] | None = None
 
     @override
     def __repr__(self) -> str:
@@ -61,8 +74,8 @@ class RegisteredTypeBag[InstanceT]:
         return self.has_type(t) or self.has_match_all()
 
     def get_type(self, t: Type[InstanceT]) -> RegisteredType[InstanceT]:
-        if (h := hash(t)) in self._types:
-            return self._types[h]
+        if (r_type := self._types.get(hash(t))) is not None:
+            return r_type
         if self._match_all is not None:
             return RegisteredType(
                 self._match_all.intrfc_t,
@@ -1,12 +1,13 @@
 import logging
 import logging.handlers
-from datetime import UTC, datetime
+import time
 from pathlib import Path
-from typing import ClassVar, Protocol, override
+from typing import Any, ClassVar, Protocol, override
 
 from bolinette.core import meta
 from bolinette.core.injection.resolver import ArgResolverOptions
 from bolinette.core.objects import CoreSection, FileLoggingConfig, StreamLoggingConfig
+from bolinette.core.types import Type
 
 
 class SupportsWrite[T](Protocol):
@@ -42,24 +43,32 @@ class ConsoleColorCode:
     BgWhite = "\x1b[47m"
 
 
+_last_sec: int = -1
+_last_sec_str: str = ""
+
+
+def _format_timestamp(created: float) -> str:
+    global _last_sec, _last_sec_str
+    sec = int(created)
+    if sec != _last_sec:
+        _last_sec_str = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        _last_sec = sec
+    return f"{_last_sec_str}.{int((created - sec) * 1_000_000):06d}Z"
+
+
 class BasicFormatter(logging.Formatter):
     def __init__(self, name: str) -> None:
         super().__init__()
         self.name = name
+        self._formatter = logging.Formatter(f"%(timestamp)s [%(levelname)s] <{name}> %(message)s")
 
     @override
     def format(self, record: logging.LogRecord) -> str:
-        record.timestamp = datetime.fromtimestamp(record.created, UTC).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
-        record.service = self.name
-        formatted_str = "%(timestamp)s [%(levelname)s] <%(service)s> %(message)s"
-        return logging.Formatter(formatted_str).format(record)
+        record.timestamp = _format_timestamp(record.created)
+        return self._formatter.format(record)
 
 
 class ColorFormatter(logging.Formatter):
-    def __init__(self, name: str) -> None:
-        super().__init__()
-        self.name = name
-
     COLORS: ClassVar[dict[int, str]] = {
         logging.DEBUG: ConsoleColorCode.FgBlue,
         logging.INFO: ConsoleColorCode.FgGreen,
@@ -70,16 +79,22 @@ class ColorFormatter(logging.Formatter):
         logging.FATAL: ConsoleColorCode.BgRed + ConsoleColorCode.FgBlack,
     }
 
+    def __init__(self, name: str) -> None:
+        super().__init__()
+        self.name = name
+        self._formatters = {
+            levelno: logging.Formatter(
+                f"%(timestamp)s "
+                f"[{ConsoleColorCode.Bright}{color}{logging.getLevelName(levelno)}{ConsoleColorCode.Reset}] "
+                f"<{ConsoleColorCode.FgGreen}{name}{ConsoleColorCode.Reset}> %(message)s"
+            )
+            for levelno, color in self.COLORS.items()
+        }
+
     @override
     def format(self, record: logging.LogRecord) -> str:
-        record.timestamp = datetime.fromtimestamp(record.created, UTC).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
-        record.service = self.name
-        formatted_str = (
-            f"%(timestamp)s "
-            f"[{ConsoleColorCode.Bright}{self.COLORS[record.levelno]}%(levelname)s{ConsoleColorCode.Reset}] "
-            f"<{ConsoleColorCode.FgGreen}%(service)s{ConsoleColorCode.Reset}> %(message)s"
-        )
-        return logging.Formatter(formatted_str).format(record)
+        record.timestamp = _format_timestamp(record.created)
+        return self._formatters[record.levelno].format(record)
 
 
 class Logger[T](logging.Logger): ...
@@ -88,11 +103,14 @@ class Logger[T](logging.Logger): ...
 class LoggerArgResolver:
     def __init__(self, core_config: CoreSection) -> None:
         self.config = core_config
+        self._loggers: dict[Type[Any], logging.Logger] = {}
 
     def supports(self, options: ArgResolverOptions) -> bool:
         return options.t.cls is Logger
 
     def resolve(self, options: ArgResolverOptions) -> logging.Logger:
+        if (logger := self._loggers.get(options.t)) is not None:
+            return logger
         logger = logging.getLogger(f"__blnt_logger__.{options.t}")
         if not meta.has(logger, LoggerArgResolver):
             meta.set(logger, self)
@@ -109,6 +127,7 @@ class LoggerArgResolver:
                         self._add_console_logger(logger, logger_name, config)
                     elif config.type == "file":
                         self._add_file_logger(logger, logger_name, config)
+        self._loggers[options.t] = logger
         return logger
 
     @staticmethod
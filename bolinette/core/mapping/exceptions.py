@@ -1,5 +1,5 @@
 from collections.abc import Iterable, Sequence
-from typing import Any
+from typing import Any, ClassVar
 
 from bolinette.core.exceptions import BolinetteError, ParameterError
 from bolinette.core.expressions import ExpressionNode
@@ -7,8 +7,10 @@ from bolinette.core.types import Type
 
 
 class MappingError(BolinetteError, ParameterError):
+    _PARAM_TEMPLATES: ClassVar[dict[str, str]] = {"dest": "Destination path '{}'", "src": "From source path '{}'"}
+
     def __init__(self, message: str, *, src: ExpressionNode | None = None, dest: ExpressionNode | None = None) -> None:
-        ParameterError.__init__(self, dest="Destination path '{}'", src="From source path '{}'")
+        ParameterError.__init__(self, self._PARAM_TEMPLATES)
         BolinetteError.__init__(self, self._format_params(message, dest=dest, src=src))
         self.src = src
         self.dest = dest
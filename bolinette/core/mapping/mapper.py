@@ -35,6 +35,7 @@ class Mapper:
         self._sequences: dict[int, MappingSequence[Any, Any]] = {}
         self._type_mappers: TypeCollection[type[MappingWorker[Any]]] = TypeCollection()
         self._default_mapper: type[MappingWorker[object]] = ObjectMapper
+        self._runner: MappingRunner | None = None
 
     @init_method
     def _init_profiles(self, cache: Cache, inject: Injection) -> None:
@@ -45,6 +46,7 @@ class Mapper:
                 sequence.complete(completed)
                 completed[hash(sequence)] = sequence
         self._sequences = completed
+        self._runner = None
 
     @init_method
     def _init_type_mappers(self, cache: Cache) -> None:
@@ -60,9 +62,11 @@ class Mapper:
                 self._type_mappers.add(t, mapper_t.cls, match_all=match_all)
         else:
             self._type_mappers.add(mapped_t, mapper_t.cls, match_all=match_all)
+        self._runner = None
 
     def set_default_type_mapper(self, mapper: "type[MappingWorker[object]]") -> None:
         self._default_mapper = mapper
+        self._runner = None
 
     @overload
     def map[SrcT, DestT: NoInitDestination](
@@ -111,7 +115,9 @@ class Mapper:
         else:
             exc_grp = None
 
-        mapped = MappingRunner(self._sequences, self._type_mappers, self._default_mapper).map(
+        if (runner := self._runner) is None:
+            runner = self._runner = MappingRunner(self._sequences, self._type_mappers, self._default_mapper)
+        mapped = runner.map(
             src_expr or ExpressionTree.new(src_t),
             src_t,
             dest_expr or ExpressionTree.new(dest_t),
@@ -256,12 +262,13 @@ class ObjectMapper(MappingWorker[Any]):
         if sequence is not None:
             for func in sequence.head:
                 func.func(src, dest)
+        src_root_expr = ExpressionTree.new(src_t)
         for dest_name, anno_t in dest_t.annotations().items():
             src_name = dest_name
             field_src_expr = self._get_expr(src_expr, src, src_name)
             field_dest_expr: ExpressionNode = getattr(dest_expr, dest_name)
             selected_t: Type[Any] | None = None
-            src_value_expr = self._get_expr(ExpressionTree.new(src_t), src, src_name)
+            src_value_expr = self._get_expr(src_root_expr, src, src_name)
             if sequence is not None and dest_name in sequence.for_attrs:
                 for_attr = sequence.for_attrs[dest_name]
                 if isinstance(for_attr, IgnoreAttribute):
@@ -6,6 +6,8 @@ from bolinette.core.expressions import ExpressionNode, ExpressionTree
 from bolinette.core.injection import Injection
 from bolinette.core.injection.pool import InstancePool
 
+_generic_params_cache: dict[Any, tuple[type[Any], tuple[Any, ...]]] = {}
+
 
 class _MockedMeta[MockedT]:
     def __init__(self, cls: type[MockedT]) -> None:
@@ -23,7 +25,9 @@ class _MockedMeta[MockedT]:
 
     def __getitem__(self, key: str) -> Any:
         if key not in self._attrs and self.dummy:
-            return self._get_dummy(key)
+            value = self._get_dummy(key)
+            self._attrs[key] = value
+            return value
         return self._attrs[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
@@ -36,27 +40,25 @@ class _MockWrapper[MockedT]:
         cls: type[MockedT],
     ) -> None:
         self._cls = self._setup_mocked_cls(cls)
+        self._meta: _MockedMeta[MockedT] = meta.get(self._cls, _MockedMeta)
         self.instance = self._cls()
 
-    @staticmethod
-    def _get_mocked_attr(_cls: type[MockedT], instance: MockedT, name: str) -> Any:
-        if name == "__class__":
-            return _cls
-        _meta: _MockedMeta[Any] = meta.get(type(instance), _MockedMeta)
-        if name in _meta:
-            return _meta[name]
-        raise KeyError(f"'{name}' attribute has not been mocked in {_cls}")
-
     @staticmethod
     def _setup_mocked_cls(_cls: type[MockedT]) -> type[MockedT]:
+        _meta: _MockedMeta[MockedT] = _MockedMeta(_cls)
+
         def _get_attr(instance: object, name: str) -> Any:
-            return _MockWrapper._get_mocked_attr(_cls, instance, name)  # pyright: ignore[reportUnknownMemberType]
+            if name == "__class__":
+                return _cls
+            if name in _meta:
+                return _meta[name]
+            raise KeyError(f"'{name}' attribute has not been mocked in {_cls}")
 
         _t = type(f"{_cls.__name__}__Mocked", (_cls,), {})
         _t.__init__ = lambda _: None  # pyright: ignore[reportAttributeAccessIssue]
         _t.__repr__ = lambda _: f"<Mocked[{_cls.__name__}]>"  # pyright: ignore[reportAttributeAccessIssue]
         _t.__getattribute__ = _get_attr
-        meta.set(_t, _MockedMeta(_cls))
+        meta.set(_t, _meta)
         return _t  # pyright: ignore
 
     def setup_callable[**FuncP, FuncT](
@@ -71,13 +73,11 @@ class _MockWrapper[MockedT]:
         expr: ExpressionNode = func(ExpressionTree.new())  # pyright: ignore
         ExpressionTree.ensure_attribute_chain(expr)
         name = ExpressionTree.get_attribute(expr)
-        _meta: _MockedMeta[Any] = meta.get(self._cls, _MockedMeta)
-        _meta[name] = value
+        self._meta[name] = value
         return self
 
     def dummy(self, value: bool = True) -> "_MockWrapper[MockedT]":
-        _meta: _MockedMeta[Any] = meta.get(self._cls, _MockedMeta)
-        _meta.dummy = value
+        self._meta.dummy = value
         return self
 
 
@@ -90,12 +90,14 @@ class Mock:
     def _get_generic_params[MockedT](
         _cls: type[MockedT],
     ) -> tuple[type[MockedT], tuple[Any, ...]]:
+        if _cls in _generic_params_cache:
+            return _generic_params_cache[_cls]
         if origin := get_origin(_cls):
-            params: tuple[Any, ...] = ()
-            for arg in get_args(_cls):
-                params = (*params, arg)
-            return origin, params
-        return _cls, ()
+            result = origin, get_args(_cls)
+        else:
+            result = _cls, ()
+        _generic_params_cache[_cls] = result
+        return result
 
     def mock[MockedT](self, cls: type[MockedT], *, match_all: bool = False) -> _MockWrapper[MockedT]:
         origin, _ = self._get_generic_params(cls)
@@ -2,9 +2,34 @@ import inspect
 from collections.abc import Callable
 from types import NoneType
 from typing import Any, get_type_hints, override
+from weakref import WeakKeyDictionary
 
 from bolinette.core.types import Type, TypeVarLookup
 
+_type_hints_cache: "WeakKeyDictionary[Callable[..., Any], dict[str, Any]]" = WeakKeyDictionary()
+_parameters_cache: "WeakKeyDictionary[Callable[..., Any], dict[str, inspect.Parameter]]" = WeakKeyDictionary()
+
+
+def _cached_parameters(func: Callable[..., Any]) -> dict[str, inspect.Parameter]:
+    try:
+        params = _parameters_cache.get(func)
+    except TypeError:
+        return {**inspect.signature(func).parameters}
+    if params is None:
+        params = _parameters_cache[func] = {**inspect.signature(func).parameters}
+    return params
+
+
+def _cached_type_hints(func: Callable[..., Any]) -> dict[str, Any]:
+    func = getattr(func, "__func__", func)
+    try:
+        hints = _type_hints_cache.get(func)
+    except TypeError:
+        return get_type_hints(func, include_extras=True)
+    if hints is None:
+        hints = _type_hints_cache[func] = get_type_hints(func, include_extras=True)
+    return hints
+
 
 class Function[**FuncP, FuncT]:
     def __init__(self, func: Callable[FuncP, FuncT]) -> None:
@@ -12,9 +37,9 @@ class Function[**FuncP, FuncT]:
             raise TypeError(f"Cannot wrap {func}, already wrapped")
         self.func = func
         self.bound_to = getattr(self.func, "__self__", None)
-        self._annotations: dict[str, Any] | None = None
-        self._signature: inspect.Signature | None = None
+        self._annotations: dict[Any, dict[str, Any]] = {}
         self._parameters: dict[str, inspect.Parameter] | None = None
+        self._has_positional: bool | None = None
 
     @property
     def name(self) -> str:
@@ -22,22 +47,27 @@ class Function[**FuncP, FuncT]:
 
     def parameters(self) -> dict[str, inspect.Parameter]:
         if self._parameters is None:
-            if self._signature is None:
-                self._signature = inspect.signature(self.func)
-            self._parameters = {**self._signature.parameters}
+            self._parameters = _cached_parameters(self.func)
         return self._parameters
 
+    def has_positional_params(self) -> bool:
+        if self._has_positional is None:
+            self._has_positional = any(
+                p.kind in (p.POSITIONAL_ONLY, p.VAR_POSITIONAL) for p in self.parameters().values()
+            )
+        return self._has_positional
+
     def param_at(self, index: int) -> inspect.Parameter:
         all_params = [*self.parameters().values()]
         return all_params[index]
 
     def annotations(self, *, lookup: TypeVarLookup[Any] | None = None) -> dict[str, Any]:
-        if self._annotations is None:
-            self._annotations = {
-                n: self._transform_annotation(c, lookup)
-                for n, c in get_type_hints(self.func, include_extras=True).items()
-            }
-        return self._annotations
+        key = lookup.t if lookup is not None else None
+        if (annotations := self._annotations.get(key)) is None:
+            hints = _cached_type_hints(self.func)
+            annotations = {n: self._transform_annotation(c, lookup) for n, c in hints.items()}
+            self._annotations[key] = annotations
+        return annotations
 
     def anno_at(self, index: int) -> Any:
         return self.annotations()[self.param_at(index).name]
@@ -22,8 +22,29 @@ from typing import (
 from bolinette.core import types
 from bolinette.core.exceptions import TypingError
 
+_type_cache: "dict[Any, Type[Any]]" = {}
+
 
 class Type[T]:
+    __slots__ = (
+        "origin",
+        "annotated",
+        "required",
+        "nullable",
+        "union",
+        "total",
+        "cls",
+        "vars",
+        "_lookup",
+        "_str",
+        "_hash",
+        "_bases",
+        "_init",
+        "_annotations",
+        "_parameters",
+        "_has_positional",
+    )
+
     origin: type[T] | UnionType
     annotated: tuple[Any, ...]
     required: bool
@@ -32,12 +53,28 @@ class Type[T]:
     total: bool
     cls: Any
     vars: tuple[Any, ...]
-    lookup: "types.TypeVarLookup[T]"
 
     @staticmethod
     def from_instance(__instance: T) -> "Type[T]":
         return Type(type(__instance))
 
+    def __new__(
+        cls,
+        origin: type[T] | UnionType,
+        /,
+        *,
+        lookup: "types.TypeVarMapping | None" = None,
+        raise_on_string: bool = True,
+        raise_on_typevar: bool = True,
+    ) -> "Type[T]":
+        if lookup is None and raise_on_string and raise_on_typevar:
+            try:
+                if (cached := _type_cache.get(origin)) is not None:
+                    return cached
+            except TypeError:
+                pass
+        return super().__new__(cls)
+
     @overload
     def __init__(
         self,
@@ -71,6 +108,8 @@ class Type[T]:
         raise_on_string: bool = True,
         raise_on_typevar: bool = True,
     ) -> None:
+        if hasattr(self, "_hash"):
+            return
         self.origin = origin
         self.annotated = ()
         self.required = True
@@ -79,13 +118,20 @@ class Type[T]:
         cls = self._unpack_annotations(origin)
         self.total = getattr(cls, "__total__", True)
         self.cls, self.vars = Type.get_generics(cls, lookup, raise_on_string, raise_on_typevar)
-        self.vars = (
-            *self.vars,
-            *map(lambda _: Any, range(len(self.vars), Type.get_param_count(self.cls))),
-        )
-        self.lookup = types.TypeVarLookup(self)
+        self.vars = (*self.vars, *(Any,) * (Type.get_param_count(self.cls) - len(self.vars)))
+        self._lookup: types.TypeVarLookup[T] | None = None
+        self._str: str | None = None
         self._hash = hash((self.cls, self.vars))
         self._bases: tuple[Type[Any], ...] | None = None
+        self._init: "types.Function[..., None] | None" = None
+        self._annotations: "dict[str, Type[Any]] | None" = None
+        self._parameters: dict[str, inspect.Parameter] | None = None
+        self._has_positional: bool | None = None
+        if lookup is None and raise_on_string and raise_on_typevar:
+            try:
+                _type_cache[origin] = self
+            except TypeError:
+                pass
 
     def _unpack_annotations(self, cls: Any) -> Any:
         if isinstance(cls, TypeAliasType):
@@ -121,6 +167,12 @@ class Type[T]:
             return f"'{v.__forward_arg__}'"
         return str(v)
 
+    @property
+    def lookup(self) -> "types.TypeVarLookup[T]":
+        if self._lookup is None:
+            self._lookup = types.TypeVarLookup(self)
+        return self._lookup
+
     @property
     def base_name(self) -> str:
         return self._format_type(self.cls)
@@ -140,6 +192,9 @@ class Type[T]:
 
     @override
     def __str__(self) -> str:
+        if self._str is not None:
+            return self._str
+
         if self.is_union:
             repr_str = " | ".join(str(t) for t in self.union)
         else:
@@ -151,6 +206,7 @@ class Type[T]:
         if self.nullable:
             repr_str += " | None"
 
+        self._str = repr_str
         return repr_str
 
     @override
@@ -171,7 +227,9 @@ class Type[T]:
 
     @property
     def init(self):
-        return types.Function(self.cls.__init__)
+        if self._init is None:
+            self._init = types.Function(self.cls.__init__)
+        return self._init
 
     @property
     def is_union(self) -> bool:
@@ -185,10 +243,21 @@ class Type[T]:
         return self.cls(*args, **kwargs)
 
     def parameters(self) -> dict[str, inspect.Parameter]:
-        return {**inspect.signature(self.cls).parameters}
+        if self._parameters is None:
+            self._parameters = {**inspect.signature(self.cls).parameters}
+        return self._parameters
+
+    def has_positional_params(self) -> bool:
+        if self._has_positional is None:
+            self._has_positional = any(
+                p.kind in (p.POSITIONAL_ONLY, p.VAR_POSITIONAL) for p in self.parameters().values()
+            )
+        return self._has_positional
 
     def annotations(self) -> "dict[str, Type[Any]]":
-        return self._get_recursive_annotations(self.cls)
+        if self._annotations is None:
+            self._annotations = self._get_recursive_annotations(self.cls)
+        return self._annotations
 
     def isinstance(self, instance: Any) -> TypeGuard[T]:
         return isinstance(instance, self.cls)
@@ -1,4 +1,7 @@
 from typing import Any, overload
+from weakref import WeakKeyDictionary
+
+_cls_attrs_cache: "WeakKeyDictionary[type[Any], dict[type[Any] | None, dict[str, Any]]]" = WeakKeyDictionary()
 
 
 class AttributeUtils:
@@ -16,11 +19,17 @@ class AttributeUtils:
         *,
         of_type: type[InstanceT] | None = None,
     ) -> dict[str, InstanceT]:
+        if (by_type := _cls_attrs_cache.get(obj)) is None:
+            by_type = _cls_attrs_cache[obj] = {}
+        elif of_type in by_type:
+            return by_type[of_type]
         parent_attrs: dict[str, Any] = {}
         for parent in obj.__bases__:
             parent_attrs |= AttributeUtils.get_cls_attrs(parent, of_type=of_type)
-        return parent_attrs | {
+        attrs = parent_attrs | {
             name: attribute
             for name, attribute in vars(obj).items()
             if of_type is None or isinstance(attribute, of_type)
         }
+        by_type[of_type] = attrs
+        return attrs
@@ -1,45 +1,34 @@
 from collections.abc import Iterable, Iterator
-from typing import override
 
 
-class OrderedSet[T](set[T]):
+class OrderedSet[T]:
     def __init__(self, iterable: Iterable[T] | None = None, /) -> None:
-        super().__init__(iterable or ())
-        self._order: list[T] = []
+        self._items: dict[T, None] = dict.fromkeys(iterable) if iterable is not None else {}
 
-    @override
     def add(self, element: T, /) -> None:
-        super().add(element)
-        self._order.append(element)
+        self._items[element] = None
 
-    @override
     def remove(self, element: T, /) -> None:
-        super().remove(element)
-        self._order.remove(element)
+        del self._items[element]
 
-    @override
     def pop(self) -> T:
-        element = super().pop()
-        self._order.remove(element)
-        return element
+        return self._items.popitem()[0]
 
-    @override
     def discard(self, element: T, /) -> None:
-        super().discard(element)
-        if element in self._order:
-            self._order.remove(element)
+        self._items.pop(element, None)
 
-    @override
     def update(self, *sets: Iterable[T]) -> None:
-        super().update(*sets)
         for s in sets:
-            for element in s:
-                if element not in self._order:
-                    self._order.append(element)
+            self._items.update(dict.fromkeys(s))
 
     def __getitem__(self, key: int) -> T:
-        return self._order[key]
+        return list(self._items)[key]
+
+    def __contains__(self, element: object, /) -> bool:
+        return element in self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
 
-    @override
     def __iter__(self) -> Iterator[T]:
-        return iter(self._order)
+        return iter(self._items)
@@ -67,7 +67,7 @@ class DatabaseManager:
                 )
             system = self.get_system(scheme)
             self._connections.append(DatabaseConnection(db_config.name, db_config.url, db_config.echo, system.manager))
-            self._logger.debug(f"Opening connection to {db_config.url}")
+            self._logger.debug("Opening connection to %s", db_config.url)
 
 
 class DatabaseSystem(Protocol):
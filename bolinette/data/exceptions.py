@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, ClassVar
 
 from bolinette.core.exceptions import BolinetteError, ParameterError
 
@@ -8,6 +8,12 @@ class DataError(BolinetteError):
 
 
 class EntityError(DataError, ParameterError):
+    _PARAM_TEMPLATES: ClassVar[dict[str, str]] = {
+        "entity": "Entity {}",
+        "attribute": "Attribute '{}'",
+        "constraint": "Constraint {}",
+    }
+
     def __init__(
         self,
         message: str,
@@ -16,12 +22,7 @@ class EntityError(DataError, ParameterError):
         attribute: str | None = None,
         constraint: str | None = None,
     ) -> None:
-        ParameterError.__init__(
-            self,
-            entity="Entity {}",
-            attribute="Attribute '{}'",
-            constraint="Constraint {}",
-        )
+        ParameterError.__init__(self, self._PARAM_TEMPLATES)
         BolinetteError.__init__(
             self,
             self._format_params(message, entity=entity, attribute=attribute, constraint=constraint),
@@ -29,6 +30,12 @@ class EntityError(DataError, ParameterError):
 
 
 class DatabaseError(DataError, ParameterError):
+    _PARAM_TEMPLATES: ClassVar[dict[str, str]] = {
+        "system": "Database system '{}'",
+        "connection": "Database connection '{}'",
+        "entity": "Entity {}",
+    }
+
     def __init__(
         self,
         message: str,
@@ -37,12 +44,7 @@ class DatabaseError(DataError, ParameterError):
         connection: str | None = None,
         entity: type[Any] | None = None,
     ) -> None:
-        ParameterError.__init__(
-            self,
-            system="Database system '{}'",
-            connection="Database connection '{}'",
-            entity="Entity {}",
-        )
+        ParameterError.__init__(self, self._PARAM_TEMPLATES)
         BolinetteError.__init__(
             self,
             self._format_params(message, system=system, connection=connection, entity=entity),
@@ -1,3 +1,4 @@
+import asyncio
 from typing import Any
 
 from bolinette.core import Cache, meta
@@ -99,8 +100,7 @@ class EntityManager:
         return cls in self._entities
 
     async def create_all(self) -> None:
-        for engine in self._engines.values():
-            await engine.create_all()
+        await asyncio.gather(*(engine.create_all() for engine in self._engines.values()))
 
 
 async def create_tables_for_memory_db(entities: EntityManager, logger: Logger[EntityManager]) -> None:
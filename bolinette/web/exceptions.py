@@ -1,6 +1,6 @@
 import traceback
 from http import HTTPStatus
-from typing import Any, NotRequired, TypedDict, override
+from typing import Any, ClassVar, NotRequired, TypedDict, override
 
 from bolinette.core.exceptions import BolinetteError, ParameterError
 from bolinette.core.expressions import ExpressionNode, ExpressionTree
@@ -9,6 +9,8 @@ from bolinette.web.controller import Controller
 
 
 class WebError(BolinetteError, ParameterError):
+    _PARAM_TEMPLATES: ClassVar[dict[str, str]] = {"ctrl": "Controller {}", "route": "Route {}"}
+
     def __init__(
         self,
         message: str,
@@ -19,17 +21,21 @@ class WebError(BolinetteError, ParameterError):
         ctrl: Type[Controller] | None = None,
         route: Function[..., Any] | None = None,
     ) -> None:
-        ParameterError.__init__(self, ctrl="Controller {}", route="Route {}")
+        ParameterError.__init__(self, self._PARAM_TEMPLATES)
         BolinetteError.__init__(self, self._format_params(message, ctrl=ctrl, route=route))
         self.error_code = error_code
         self.status = status
         self.error_args = error_args or {}
+        self._str: str | None = None
 
     @override
     def __str__(self) -> str:
-        if not self.error_args:
-            return self.error_code
-        return f"{self.error_code}|{'|'.join(f'{k}:{v}' for k,v in self.error_args.items())}"
+        if self._str is None:
+            if not self.error_args:
+                self._str = self.error_code
+            else:
+                self._str = f"{self.error_code}|{'|'.join(f'{k}:{v}' for k,v in self.error_args.items())}"
+        return self._str
 
 
 class GroupedWebError(WebError):
@@ -183,13 +189,15 @@ class InternalServerError(WebError):
 
 
 class DispatchError(BolinetteError, ParameterError):
+    _PARAM_TEMPLATES: ClassVar[dict[str, str]] = {"route": "Route {}"}
+
     def __init__(
         self,
         message: str,
         *,
         route: str | None = None,
     ) -> None:
-        ParameterError.__init__(self, route="Route {}")
+        ParameterError.__init__(self, self._PARAM_TEMPLATES)
         BolinetteError.__init__(self, self._format_params(message, route=route))
 
 
@@ -157,7 +157,7 @@ class WebResources:
             return await self._call_controller(route, request, scoped)
         else:
             mdlw = mdlws[index]
-            self.logger.debug(f"Calling middleware {mdlw.__class__.__qualname__}")
+            self.logger.debug("Calling middleware %s", mdlw.__class__.__qualname__)
             return await scoped.call(mdlw.handle, args=[_next_handle])
 
     async def _call_controller(
@@ -171,7 +171,7 @@ class WebResources:
         except json.JSONDecodeError:
             body = None
         ctrl = scoped.instantiate(route.controller.cls)
-        self.logger.debug(f"Calling controller route {route.func}(...)")
+        self.logger.debug("Calling controller route %s(...)", route.func)
         return scoped.call(
             route.func.func,
             args=[ctrl],
@@ -1,4 +1,5 @@
 import sys
+from types import SimpleNamespace
 from typing import Annotated, Any, Literal
 
 import pytest
@@ -13,356 +14,196 @@ from bolinette.core.testing import Mock
 from bolinette.core.types import Function
 
 
-def test_decorate_command() -> None:
-    cache = Cache()
-
-    @command("command", "This is a test command", cache=cache)
-    async def _command() -> None:
-        pass
-
-    assert CommandMeta in cache
-    assert cache.get(CommandMeta, hint=Function)[0].func == _command
-
-
-async def test_launch_command() -> None:
-    cache = Cache()
-    mock = Mock(cache=cache)
-    mock.injection.add_singleton(Parser)
-    mock.mock(Logger[Parser])
-
-    value = 1
-
-    exited = False
-
-    def _catch_exit(*_) -> None:
-        nonlocal exited
-        exited = True
-
-    @command("command", "This is a test command", cache=cache)
-    async def _() -> None:
-        nonlocal value
-        value += 1
-
-    parser = mock.injection.require(Parser)
-
-    _exit = sys.exit
-    sys.exit = _catch_exit
-
-    cmd, args = parser.parse_command(["command"])
-    await mock.injection.call(cmd.func.func, named_args=args)
-    assert value == 2
-
-    assert not exited
-
-    sys.exit = _exit
-
-
-async def test_launch_command_not_found() -> None:
-    cache = Cache()
-    mock = Mock(cache=cache)
-    mock.injection.add_singleton(Parser)
-
-    value = 1
-
-    exited = False
-
-    def _catch_exit(*_) -> None:
-        nonlocal exited
-        exited = True
-
-    error_str = ""
-
-    def _write_error(s: str) -> None:
-        nonlocal error_str
-        error_str = s
-
-    mock.mock(Logger[Parser]).setup(lambda logger: logger.error, _write_error)
-
-    @command("command", "This is a test command", cache=cache)
-    async def _() -> None:
-        nonlocal value
-        value += 1
-
-    parser = mock.injection.require(Parser)
-
-    _exit = sys.exit
-    sys.exit = _catch_exit
-
-    parser.parse_command(["none"])
-    assert value == 1
-
-    assert exited
-
-    sys.exit = _exit
-
-
-async def test_launch_sub_command() -> None:
+@pytest.fixture
+def parser_env() -> SimpleNamespace:
     cache = Cache()
     mock = Mock(cache=cache)
     mock.injection.add_singleton(Parser)
     mock.mock(Logger[Parser])
+    return SimpleNamespace(cache=cache, mock=mock)
 
-    value = 1
 
-    exited = False
+async def _run_command(mock: Mock, parser: Parser, *argv: str) -> None:
+    cmd, args = parser.parse_command([*argv])
+    await mock.injection.call(cmd.func, named_args=args)
 
-    def _catch_exit(*_) -> None:
-        nonlocal exited
-        exited = True
 
+def _register_inc_dec(cache: Cache, state: SimpleNamespace) -> None:
     @command("command inc", "This is a test command", cache=cache)
     async def _() -> None:
-        nonlocal value
-        value += 1
+        state.value += 1
 
     @command("command dec", "This is a test command", cache=cache)
     async def _() -> None:
-        nonlocal value
-        value -= 1
-
-    parser = mock.injection.require(Parser)
-
-    _exit = sys.exit
-    sys.exit = _catch_exit
-
-    cmd, args = parser.parse_command(["command", "inc"])
-    await mock.injection.call(cmd.func, named_args=args)
-    assert value == 2
-
-    cmd, args = parser.parse_command(["command", "dec"])
-    await mock.injection.call(cmd.func, named_args=args)
-    assert value == 1
-
-    assert not exited
+        state.value -= 1
 
-    sys.exit = _exit
 
-
-async def test_launch_sub_command_not_found() -> None:
+def test_decorate_command() -> None:
     cache = Cache()
-    mock = Mock(cache=cache)
-    mock.injection.add_singleton(Parser)
 
-    value = 1
+    @command("command", "This is a test command", cache=cache)
+    async def _command() -> None:
+        pass
 
-    exited = False
+    assert CommandMeta in cache
+    assert cache.get(CommandMeta, hint=Function)[0].func == _command
 
-    def _catch_exit(*_) -> None:
-        nonlocal exited
-        exited = True
 
-    @command("command inc", "This is a test command", cache=cache)
-    async def _() -> None:
-        nonlocal value
-        value += 1
+async def test_launch_command(parser_env: SimpleNamespace, monkeypatch: pytest.MonkeyPatch) -> None:
+    state = SimpleNamespace(value=1, exited=False)
 
-    @command("command dec", "This is a test command", cache=cache)
+    @command("command", "This is a test command", cache=parser_env.cache)
     async def _() -> None:
-        nonlocal value
-        value -= 1
+        state.value += 1
 
-    parser = mock.injection.require(Parser)
+    parser = parser_env.mock.injection.require(Parser)
 
-    _exit = sys.exit
-    sys.exit = _catch_exit
-
-    parser.parse_command(["command", "none"])
-    assert value == 1
+    monkeypatch.setattr(sys, "exit", lambda *_: setattr(state, "exited", True))
 
-    assert exited
+    await _run_command(parser_env.mock, parser, "command")
+    assert state.value == 2
 
-    sys.exit = _exit
+    assert not state.exited
 
 
-async def test_command_argument() -> None:
-    cache = Cache()
-    mock = Mock(cache=cache)
-    mock.injection.add_singleton(Parser)
-    mock.mock(Logger[Parser])
+async def test_launch_command_not_found(parser_env: SimpleNamespace, monkeypatch: pytest.MonkeyPatch) -> None:
+    state = SimpleNamespace(value=1, exited=False, error_str="")
 
-    value = 0
+    parser_env.mock.mock(Logger[Parser]).setup(lambda logger: logger.error, lambda s: setattr(state, "error_str", s))
 
-    @command("command", "This is a test command", cache=cache)
-    async def _(param: Annotated[int, Argument()]) -> None:
-        nonlocal value
-        value = param
+    @command("command", "This is a test command", cache=parser_env.cache)
+    async def _() -> None:
+        state.value += 1
 
-    parser = mock.injection.require(Parser)
+    parser = parser_env.mock.injection.require(Parser)
 
-    cmd, args = parser.parse_command(["command", "42"])
-    await mock.injection.call(cmd.func, named_args=args)
+    monkeypatch.setattr(sys, "exit", lambda *_: setattr(state, "exited", True))
 
-    assert value == 42
+    parser.parse_command(["none"])
+    assert state.value == 1
 
+    assert state.exited
 
-async def test_command_with_injection() -> None:
-    cache = Cache()
-    mock = Mock(cache=cache)
-    mock.injection.add_singleton(Parser)
-    mock.mock(Logger[Parser])
 
-    value = 0
+async def test_launch_sub_command(parser_env: SimpleNamespace, monkeypatch: pytest.MonkeyPatch) -> None:
+    state = SimpleNamespace(value=1, exited=False)
 
-    @command("command", "This is a test command", cache=cache)
-    async def _(cache: Cache, param: Annotated[int, Argument]) -> None:
-        nonlocal value
-        value = len(cache.get(CommandMeta, hint=CommandMeta)) + param
+    _register_inc_dec(parser_env.cache, state)
 
-    parser = mock.injection.require(Parser)
+    parser = parser_env.mock.injection.require(Parser)
 
-    cmd, args = parser.parse_command(["command", "42"])
-    await mock.injection.call(cmd.func, named_args=args)
+    monkeypatch.setattr(sys, "exit", lambda *_: setattr(state, "exited", True))
 
-    assert value == 43
+    await _run_command(parser_env.mock, parser, "command", "inc")
+    assert state.value == 2
 
+    await _run_command(parser_env.mock, parser, "command", "dec")
+    assert state.value == 1
 
-async def test_command_option() -> None:
-    cache = Cache()
-    mock = Mock(cache=cache)
-    mock.injection.add_singleton(Parser)
-    mock.mock(Logger[Parser])
+    assert not state.exited
 
-    value = 0
 
-    @command("command", "This is a test command", cache=cache)
-    async def _(param: Annotated[int, Argument("option")]) -> None:
-        nonlocal value
-        value = param
-
-    parser = mock.injection.require(Parser)
+async def test_launch_sub_command_not_found(parser_env: SimpleNamespace, monkeypatch: pytest.MonkeyPatch) -> None:
+    state = SimpleNamespace(value=1, exited=False)
 
-    cmd, args = parser.parse_command(["command", "--param", "42"])
-    await mock.injection.call(cmd.func, named_args=args)
+    _register_inc_dec(parser_env.cache, state)
 
-    assert value == 42
+    parser = parser_env.mock.injection.require(Parser)
 
+    monkeypatch.setattr(sys, "exit", lambda *_: setattr(state, "exited", True))
 
-async def test_command_option_flag() -> None:
-    cache = Cache()
-    mock = Mock(cache=cache)
-    mock.injection.add_singleton(Parser)
-    mock.mock(Logger[Parser])
-
-    value = 0
-
-    @command("command", "This is a test command", cache=cache)
-    async def _(param: Annotated[int, Argument("option", "p")]):
-        nonlocal value
-        value = param
-
-    parser = mock.injection.require(Parser)
-
-    cmd, args = parser.parse_command(["command", "-p", "42"])
-    await mock.injection.call(cmd.func, named_args=args)
+    parser.parse_command(["command", "none"])
+    assert state.value == 1
 
-    assert value == 42
+    assert state.exited
 
 
-async def test_command_flag() -> None:
-    cache = Cache()
-    mock = Mock(cache=cache)
-    mock.injection.add_singleton(Parser)
-    mock.mock(Logger[Parser])
+@pytest.mark.parametrize(
+    ("param_type", "argument", "argv", "expected"),
+    [
+        (int, Argument(), ["42"], 42),
+        (int, Argument("option"), ["--param", "42"], 42),
+        (int, Argument("option", "p"), ["-p", "42"], 42),
+        (Literal[True], Argument("option"), ["--param"], True),
+        (Literal[True], Argument("option", "p"), ["-p"], True),
+    ],
+)
+async def test_command_argument_kinds(
+    parser_env: SimpleNamespace,
+    param_type: Any,
+    argument: Argument,
+    argv: list[str],
+    expected: Any,
+) -> None:
+    state = SimpleNamespace(value=None)
 
-    value = False
+    @command("command", "This is a test command", cache=parser_env.cache)
+    async def _(param: Annotated[param_type, argument]) -> None:  # pyright: ignore[reportInvalidTypeForm]
+        state.value = param
 
-    @command("command", "This is a test command", cache=cache)
-    async def _(param: Annotated[Literal[True], Argument("option")]):
-        nonlocal value
-        value = param
+    parser = parser_env.mock.injection.require(Parser)
 
-    parser = mock.injection.require(Parser)
+    await _run_command(parser_env.mock, parser, "command", *argv)
 
-    cmd, args = parser.parse_command(["command", "--param"])
-    await mock.injection.call(cmd.func, named_args=args)
+    assert state.value == expected
 
-    assert value is True
 
+async def test_command_with_injection(parser_env: SimpleNamespace) -> None:
+    state = SimpleNamespace(value=0)
 
-async def test_command_flag_flag() -> None:
-    cache = Cache()
-    mock = Mock(cache=cache)
-    mock.injection.add_singleton(Parser)
-    mock.mock(Logger[Parser])
-
-    value = False
-
-    @command("command", "This is a test command", cache=cache)
-    async def _(param: Annotated[Literal[True], Argument("option", "p")]):
-        nonlocal value
-        value = param
-
-    parser = mock.injection.require(Parser)
-
-    cmd, args = parser.parse_command(["command", "-p"])
-    await mock.injection.call(cmd.func, named_args=args)
+    @command("command", "This is a test command", cache=parser_env.cache)
+    async def _(cache: Cache, param: Annotated[int, Argument]) -> None:
+        state.value = len(cache.get(CommandMeta, hint=CommandMeta)) + param
 
-    assert value is True
+    parser = parser_env.mock.injection.require(Parser)
 
+    await _run_command(parser_env.mock, parser, "command", "42")
 
-async def test_command_argument_help(capsys: CaptureFixture[Any]) -> None:
-    cache = Cache()
-    mock = Mock(cache=cache)
-    mock.injection.add_singleton(Parser)
-    mock.mock(Logger[Parser])
+    assert state.value == 43
 
-    exited = False
 
-    def _catch_exit(*_) -> None:
-        nonlocal exited
-        exited = True
+async def test_command_argument_help(
+    parser_env: SimpleNamespace, monkeypatch: pytest.MonkeyPatch, capsys: CaptureFixture[Any]
+) -> None:
+    state = SimpleNamespace(exited=False)
 
-    @command("command", "This is a test command", cache=cache)
+    @command("command", "This is a test command", cache=parser_env.cache)
     async def _(_: Annotated[int, Argument("option", "p", summary="This a help text for param arg")]):
         pass
 
-    _exit = sys.exit
-    sys.exit = _catch_exit
+    monkeypatch.setattr(sys, "exit", lambda *_: setattr(state, "exited", True))
 
-    parser = mock.injection.require(Parser)
+    parser = parser_env.mock.injection.require(Parser)
 
-    cmd, args = parser.parse_command(["command", "--help"])
-    await mock.injection.call(cmd.func, named_args=args)
+    await _run_command(parser_env.mock, parser, "command", "--help")
 
-    assert exited
+    assert state.exited
 
     assert "This a help text for param arg" in capsys.readouterr().out
 
-    sys.exit = _exit
-
-
-async def test_command_conflict() -> None:
-    cache = Cache()
-    mock = Mock(cache=cache)
-    mock.injection.add_singleton(Parser)
-    mock.mock(Logger[Parser])
 
-    @command("command sub", "This is a test command", cache=cache)
+async def test_command_conflict(parser_env: SimpleNamespace) -> None:
+    @command("command sub", "This is a test command", cache=parser_env.cache)
     async def _() -> None:
         pass
 
-    @command("command sub", "This is a test command", cache=cache)
+    @command("command sub", "This is a test command", cache=parser_env.cache)
     async def _() -> None:
         pass
 
     with pytest.raises(InitError) as info:
-        mock.injection.require(Parser)
+        parser_env.mock.injection.require(Parser)
 
     assert "Conflict with 'command sub' command" in info.value.message
 
 
-async def test_fail_non_nullable_positional_arg() -> None:
-    cache = Cache()
-    mock = Mock(cache=cache)
-    mock.injection.add_singleton(Parser)
-    mock.mock(Logger[Parser])
-
-    @command("command sub", "This is a test command", cache=cache)
+async def test_fail_non_nullable_positional_arg(parser_env: SimpleNamespace) -> None:
+    @command("command sub", "This is a test command", cache=parser_env.cache)
     async def _(p1: Annotated[str | None, Argument]) -> None:
         pass
 
     with pytest.raises(InitError) as info:
-        mock.injection.require(Parser)
+        parser_env.mock.injection.require(Parser)
 
     assert (
         "Command test_fail_non_nullable_positional_arg.<locals>._, "
@@ -370,13 +211,8 @@ async def test_fail_non_nullable_positional_arg() -> None:
     )
 
 
-async def test_command_arg_types() -> None:
-    cache = Cache()
-    mock = Mock(cache=cache)
-    mock.injection.add_singleton(Parser)
-    mock.mock(Logger[Parser])
-
-    @command("command sub", "This is a test command", cache=cache)
+async def test_command_arg_types(parser_env: SimpleNamespace) -> None:
+    @command("command sub", "This is a test command", cache=parser_env.cache)
     async def _(
         p1: Annotated[str, Argument],
         p2: Annotated[int, Argument],
@@ -390,21 +226,16 @@ async def test_command_arg_types() -> None:
     ) -> None:
         pass
 
-    mock.injection.require(Parser)
-
+    parser_env.mock.injection.require(Parser)
 
-async def test_fail_wrong_arg_literal_type() -> None:
-    cache = Cache()
-    mock = Mock(cache=cache)
-    mock.injection.add_singleton(Parser)
-    mock.mock(Logger[Parser])
 
-    @command("command sub", "This is a test command", cache=cache)
+async def test_fail_wrong_arg_literal_type(parser_env: SimpleNamespace) -> None:
+    @command("command sub", "This is a test command", cache=parser_env.cache)
     async def _(p1: Annotated[Literal[1, "two"], Argument]) -> None:
         pass
 
     with pytest.raises(InitError) as info:
-        mock.injection.require(Parser)
+        parser_env.mock.injection.require(Parser)
 
     assert (
         "Command test_fail_wrong_arg_literal_type.<locals>._, "
@@ -1,3 +1,4 @@
+from types import SimpleNamespace
 from typing import override
 
 import pytest
@@ -57,11 +58,16 @@ def mock_entities(cache: Cache, name: str, base: type[DeclarativeBase]) -> type[
     return entity_type
 
 
-def test_init_engines() -> None:
+@pytest.fixture
+def manager_env() -> SimpleNamespace:
     cache = Cache()
-
     mock = Mock(cache=cache)
     mock.injection.add_singleton(EntityManager)
+    return SimpleNamespace(cache=cache, mock=mock)
+
+
+def test_init_engines(manager_env: SimpleNamespace) -> None:
+    cache, mock = manager_env.cache, manager_env.mock
 
     base = create_entity_base(cache)
     mock_db_manager(mock)
@@ -72,11 +78,8 @@ def test_init_engines() -> None:
     assert base in manager.engines
 
 
-def test_fail_init_engines_unknown_connection() -> None:
-    cache = Cache()
-
-    mock = Mock(cache=cache)
-    mock.injection.add_singleton(EntityManager)
+def test_fail_init_engines_unknown_connection(manager_env: SimpleNamespace) -> None:
+    cache, mock = manager_env.cache, manager_env.mock
 
     create_entity_base(cache)
 
@@ -88,11 +91,8 @@ def test_fail_init_engines_unknown_connection() -> None:
     assert "No 'test' database connection defined in environment" == info.value.message
 
 
-def test_fail_init_engines_non_relational_system() -> None:
-    cache = Cache()
-
-    mock = Mock(cache=cache)
-    mock.injection.add_singleton(EntityManager)
+def test_fail_init_engines_non_relational_system(manager_env: SimpleNamespace) -> None:
+    cache, mock = manager_env.cache, manager_env.mock
 
     create_entity_base(cache)
 
@@ -111,11 +111,8 @@ def test_fail_init_engines_non_relational_system() -> None:
     assert "Database connection 'test' is not a relational system" == info.value.message
 
 
-async def test_create_all() -> None:
-    cache = Cache()
-
-    mock = Mock(cache=cache)
-    mock.injection.add_singleton(EntityManager)
+async def test_create_all(manager_env: SimpleNamespace) -> None:
+    cache, mock = manager_env.cache, manager_env.mock
 
     visited: list[str] = []
 
@@ -137,11 +134,8 @@ async def test_create_all() -> None:
     assert visited == ["test"]
 
 
-async def test_open_sessions() -> None:
-    cache = Cache()
-
-    mock = Mock(cache=cache)
-    mock.injection.add_singleton(EntityManager)
+async def test_open_sessions(manager_env: SimpleNamespace) -> None:
+    cache, mock = manager_env.cache, manager_env.mock
     mock.injection.add_scoped(AsyncTransaction)
     mock.mock(Logger[AsyncTransaction]).dummy()
 
@@ -164,11 +158,8 @@ async def test_open_sessions() -> None:
     assert visited == ["test"]
 
 
-def test_init_entities() -> None:
-    cache = Cache()
-
-    mock = Mock(cache=cache)
-    mock.injection.add_singleton(EntityManager)
+def test_init_entities(manager_env: SimpleNamespace) -> None:
+    cache, mock = manager_env.cache, manager_env.mock
 
     base = create_entity_base(cache)
     mock_db_manager(mock)
@@ -183,11 +174,8 @@ def test_init_entities() -> None:
     assert not manager.is_entity_type(object)
 
 
-def test_fail_init_entities_multiple_bases() -> None:
-    cache = Cache()
-
-    mock = Mock(cache=cache)
-    mock.injection.add_singleton(EntityManager)
+def test_fail_init_entities_multiple_bases(manager_env: SimpleNamespace) -> None:
+    cache, mock = manager_env.cache, manager_env.mock
 
     base1 = create_entity_base(cache, "TestDatabase1")
     base2 = create_entity_base(cache, "TestDatabase2")
@@ -205,11 +193,8 @@ def test_fail_init_entities_multiple_bases() -> None:
     assert f"Entity {entity_type} cannot inherit from multiple declarative bases" == info.value.message
 
 
-def test_fail_init_entities_unknown_base() -> None:
-    cache = Cache()
-
-    mock = Mock(cache=cache)
-    mock.injection.add_singleton(EntityManager)
+def test_fail_init_entities_unknown_base(manager_env: SimpleNamespace) -> None:
+    cache, mock = manager_env.cache, manager_env.mock
 
     base = type("TestDatabase", (DeclarativeBase,), {})
     mock_db_manager(mock)
@@ -221,11 +206,8 @@ def test_fail_init_entities_unknown_base() -> None:
     assert f"Entity {entity_type} has no known bases as its parents" == info.value.message
 
 
-def test_init_entity_composite_entity_key() -> None:
-    cache = Cache()
-
-    mock = Mock(cache=cache)
-    mock.injection.add_singleton(EntityManager)
+def test_init_entity_composite_entity_key(manager_env: SimpleNamespace) -> None:
+    cache, mock = manager_env.cache, manager_env.mock
 
     base = create_entity_base(cache, "TestDatabase")
     mock_db_manager(mock)
@@ -252,11 +234,8 @@ def test_init_entity_composite_entity_key() -> None:
     mock.injection.require(EntityManager)
 
 
-def test_init_repositories() -> None:
-    cache = Cache()
-
-    mock = Mock(cache=cache)
-    mock.injection.add_singleton(EntityManager)
+def test_init_repositories(manager_env: SimpleNamespace) -> None:
+    cache, mock = manager_env.cache, manager_env.mock
 
     base = create_entity_base(cache)
     mock_db_manager(mock)
@@ -274,11 +253,8 @@ def test_init_repositories() -> None:
     assert mock.injection.is_registered(_Entity2Repository)
 
 
-def test_fail_init_repositories_unused_repository() -> None:
-    cache = Cache()
-
-    mock = Mock(cache=cache)
-    mock.injection.add_singleton(EntityManager)
+def test_fail_init_repositories_unused_repository(manager_env: SimpleNamespace) -> None:
+    cache, mock = manager_env.cache, manager_env.mock
 
     base = create_entity_base(cache)
     mock_db_manager(mock)